@@ -5,240 +5,329 @@ screen_time_checker.py
 支持多种时间范围：24小时、7天、30天
 """
 
+import functools
 import os
 import sqlite3
 import sys
 import json
 from datetime import datetime, timedelta
+from urllib.parse import quote
 from subprocess import run, PIPE
 from collections import defaultdict
 
+try:
+    import orjson  # 可选：安装后导出 JSON 更快
+except ImportError:
+    orjson = None
+
+# 常见应用的映射
+_COMMON_APPS = {
+    'com.apple.Safari': 'Safari',
+    'com.microsoft.VSCode': 'Visual Studio Code',
+    'com.apple.finder': 'Finder',
+    'com.apple.systempreferences': '系统设置',
+    'com.tencent.xinWeChat': '微信',
+    'com.apple.mail': '邮件',
+    'com.apple.music': '音乐',
+    'com.apple.tv': 'TV',
+    'com.apple.photos': '照片',
+    'com.apple.notes': '备忘录',
+    'com.apple.reminders': '提醒事项',
+    'com.apple.calendar': '日历',
+    'com.apple.facetime': 'FaceTime',
+    'com.apple.messages': '信息',
+}
+
+# 查找 .app 包的目录（按优先级）
+_APP_SEARCH_DIRS = (
+    "/Applications",
+    "/System/Applications",
+    "/Applications/Utilities",
+)
+
+# 批量 mdls 查询的结果：bundle_id → 显示名称（None 表示没有找到）
+_MDLS_NAMES = {}
+
+def _resolve_app_names(bundle_ids):
+    """用一次 mdls 调用批量解析多个应用的显示名称"""
+    pending = []
+    app_paths = []
+    path_owners = []
+    
+    for bundle_id in dict.fromkeys(bundle_ids):
+        if bundle_id in _COMMON_APPS or bundle_id in _MDLS_NAMES:
+            continue
+        
+        app_name = bundle_id.rpartition('.')[2] or bundle_id
+        found = False
+        for app_dir in _APP_SEARCH_DIRS:
+            app_path = f"{app_dir}/{app_name}.app"
+            if os.path.exists(app_path):
+                app_paths.append(app_path)
+                path_owners.append(bundle_id)
+                found = True
+        
+        if found:
+            pending.append(bundle_id)
+        else:
+            _MDLS_NAMES[bundle_id] = None
+    
+    if not app_paths:
+        return
+    
+    try:
+        result = run(
+            ["mdls", "-name", "kMDItemDisplayName", "-r"] + app_paths,
+            stdout=PIPE, stderr=PIPE, text=True, timeout=10
+        )
+    except:
+        return
+    
+    # -r 模式下各路径的结果以 NUL 分隔
+    display_names = result.stdout.split('\0')
+    if len(display_names) != len(app_paths):
+        return
+    
+    for bundle_id in pending:
+        _MDLS_NAMES[bundle_id] = None
+    
+    for bundle_id, display_name in zip(path_owners, display_names):
+        display_name = display_name.strip()
+        if display_name and display_name != "(null)" and _MDLS_NAMES[bundle_id] is None:
+            _MDLS_NAMES[bundle_id] = display_name
+
+@functools.lru_cache(maxsize=512)
+def _lookup_app_name(bundle_id):
+    """获取应用的显示名称"""
+    if bundle_id in _COMMON_APPS:
+        return _COMMON_APPS[bundle_id]
+    
+    # 尝试从应用包获取名称
+    app_name = bundle_id.rpartition('.')[2] or bundle_id
+    
+    # 已经批量解析过的应用不再单独调用 mdls
+    if bundle_id in _MDLS_NAMES:
+        return _MDLS_NAMES[bundle_id] or app_name.title()
+    
+    # 尝试在 Applications 文件夹中查找
+    for app_dir in _APP_SEARCH_DIRS:
+        app_path = f"{app_dir}/{app_name}.app"
+        if os.path.exists(app_path):
+            try:
+                result = run([
+                    "mdls", "-name", "kMDItemDisplayName", "-r", app_path
+                ], stdout=PIPE, stderr=PIPE, text=True, timeout=5)
+                
+                if result.returncode == 0 and result.stdout.strip():
+                    display_name = result.stdout.strip()
+                    if display_name != "(null)":
+                        return display_name
+            except:
+                pass
+    
+    # 回退到 bundle_id 的最后一部分
+    return app_name.title()
+
+@functools.lru_cache(maxsize=1024)
+def _format_time(seconds):
+    """格式化时间显示"""
+    if seconds < 60:
+        return f"{seconds:.0f}秒"
+    elif seconds < 3600:
+        return f"{seconds/60:.1f}分钟"
+    else:
+        hours = seconds // 3600
+        minutes = (seconds % 3600) // 60
+        if minutes > 0:
+            return f"{hours:.0f}小时{minutes:.0f}分钟"
+        else:
+            return f"{hours:.1f}小时"
+
 class ScreenTimeChecker:
+    # 1 秒及以下的记录视为噪声，分组前剔除
+    _SQL_USAGE = """
+    SELECT
+      ZOBJECT.ZVALUESTRING AS bundle_id,
+      SUM(ZOBJECT.ZENDDATE - ZOBJECT.ZSTARTDATE) AS seconds
+    FROM ZOBJECT
+    WHERE ZSTREAMNAME IN ('/app/usage','/app/inFocus')
+      AND ZSTARTDATE > ?
+      AND ZOBJECT.ZVALUESTRING IS NOT NULL
+      AND ZOBJECT.ZVALUESTRING != ''
+      AND ZOBJECT.ZENDDATE - ZOBJECT.ZSTARTDATE > 1
+    GROUP BY bundle_id
+    HAVING seconds > 60
+    ORDER BY seconds DESC;
+    """
+    
+    # 在 SQL 中按本地时间的小时汇总，最多返回 24 行
+    _SQL_HOURLY = """
+    SELECT
+      CAST(strftime('%H', ZOBJECT.ZSTARTDATE + 978307200, 'unixepoch', 'localtime') AS INTEGER) AS hour,
+      SUM(ZOBJECT.ZENDDATE - ZOBJECT.ZSTARTDATE) AS duration
+    FROM ZOBJECT
+    WHERE ZSTREAMNAME IN ('/app/usage','/app/inFocus')
+      AND ZSTARTDATE > ?
+      AND ZOBJECT.ZVALUESTRING IS NOT NULL
+      AND ZOBJECT.ZVALUESTRING != ''
+      AND ZOBJECT.ZENDDATE - ZOBJECT.ZSTARTDATE > 60
+    GROUP BY hour;
+    """
+    
     def __init__(self):
         self.db_path = os.path.expanduser(
             "~/Library/Application Support/Knowledge/knowledgeC.db"
         )
         self.epoch_offset = 978307200  # Mac→Unix 时间戳补偿
         
-        # 应用名称缓存
-        self.app_names = {}
+        # 数据库连接（延迟打开，多次查询复用）
+        self._conn = None
+        
+        # 数据库检查结果（只缓存成功的结果）
+        self._db_ok = None
         
+        # 查询结果缓存：天数 → 使用数据
+        self._usage_cache = {}
+        
+    def __del__(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    def _get_conn(self):
+        """获取只读数据库连接，首次调用时打开"""
+        if self._conn is None:
+            # 路径中的 #、?、% 等字符需要转义，否则 URI 会指向错误的文件
+            db_uri = f"file:{quote(os.path.abspath(self.db_path))}?mode=ro"
+            conn = sqlite3.connect(db_uri, uri=True)
+            conn.execute("PRAGMA cache_size=-64000")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA query_only=1")
+            self._conn = conn
+        return self._conn
+    
     def check_database(self):
         """检查数据库是否存在且可访问"""
+        if self._db_ok is not None:
+            return self._db_ok
+        
         if not os.path.exists(self.db_path):
             print(f"❌ 找不到数据库文件：{self.db_path}")
             print("请确保您在 macOS 上运行此脚本")
             return False
-            
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.close()
-            return True
-        except sqlite3.OperationalError as e:
-            print(f"❌ 无法访问数据库：{e}")
-            print("\n💡 解决方法：")
-            print("1. 打开 系统设置 → 隐私与安全性 → 完全磁盘访问")
-            print("2. 点击 + 号添加 Terminal（或您运行此脚本的应用）")
-            print("3. 重新运行脚本")
-            return False
-    
-    def get_app_name(self, bundle_id):
-        """获取应用的显示名称"""
-        if bundle_id in self.app_names:
-            return self.app_names[bundle_id]
-        
-        # 常见应用的映射
-        common_apps = {
-            'com.apple.Safari': 'Safari',
-            'com.microsoft.VSCode': 'Visual Studio Code',
-            'com.apple.finder': 'Finder',
-            'com.apple.systempreferences': '系统设置',
-            'com.tencent.xinWeChat': '微信',
-            'com.apple.mail': '邮件',
-            'com.apple.music': '音乐',
-            'com.apple.tv': 'TV',
-            'com.apple.photos': '照片',
-            'com.apple.notes': '备忘录',
-            'com.apple.reminders': '提醒事项',
-            'com.apple.calendar': '日历',
-            'com.apple.facetime': 'FaceTime',
-            'com.apple.messages': '信息',
-        }
         
-        if bundle_id in common_apps:
-            self.app_names[bundle_id] = common_apps[bundle_id]
-            return common_apps[bundle_id]
-        
-        # 尝试从应用包获取名称
-        app_name = bundle_id.split('.')[-1]
-        
-        # 尝试在 Applications 文件夹中查找
-        app_paths = [
-            f"/Applications/{app_name}.app",
-            f"/System/Applications/{app_name}.app",
-            f"/Applications/Utilities/{app_name}.app"
-        ]
+        # 没有读权限时不必再尝试连接
+        if not os.access(self.db_path, os.R_OK):
+            error = "没有读取权限"
+        else:
+            try:
+                self._get_conn()
+                self._db_ok = True
+                return True
+            except sqlite3.DatabaseError as e:
+                error = e
         
-        for app_path in app_paths:
-            if os.path.exists(app_path):
-                try:
-                    result = run([
-                        "mdls", "-name", "kMDItemDisplayName", "-r", app_path
-                    ], stdout=PIPE, stderr=PIPE, text=True, timeout=5)
-                    
-                    if result.returncode == 0 and result.stdout.strip():
-                        display_name = result.stdout.strip()
-                        if display_name != "(null)":
-                            self.app_names[bundle_id] = display_name
-                            return display_name
-                except:
-                    pass
-        
-        # 回退到 bundle_id 的最后一部分
-        self.app_names[bundle_id] = app_name.title()
-        return app_name.title()
+        print(f"❌ 无法访问数据库：{error}")
+        print("\n💡 解决方法：")
+        print("1. 打开 系统设置 → 隐私与安全性 → 完全磁盘访问")
+        print("2. 点击 + 号添加 Terminal（或您运行此脚本的应用）")
+        print("3. 重新运行脚本")
+        return False
+    
+    # 应用名称解析结果按 bundle_id 缓存在 _lookup_app_name 上
+    get_app_name = staticmethod(_lookup_app_name)
     
     def get_usage_data(self, days=1):
         """获取指定天数内的应用使用数据"""
+        if days in self._usage_cache:
+            return self._usage_cache[days]
+        
         if not self.check_database():
             return []
         
         try:
-            conn = sqlite3.connect(self.db_path)
-            cur = conn.cursor()
+            cur = self._get_conn().cursor()
             
             # 计算时间范围
             since = int((datetime.now() - timedelta(days=days)).timestamp()) - self.epoch_offset
             
-            sql = """
-            SELECT
-              ZOBJECT.ZVALUESTRING AS bundle_id,
-              SUM(ZOBJECT.ZENDDATE - ZOBJECT.ZSTARTDATE) AS seconds
-            FROM ZOBJECT
-            WHERE ZSTREAMNAME IN ('/app/usage','/app/inFocus')
-              AND ZSTARTDATE > ?
-              AND ZOBJECT.ZVALUESTRING IS NOT NULL
-              AND ZOBJECT.ZVALUESTRING != ''
-            GROUP BY bundle_id
-            HAVING seconds > 60
-            ORDER BY seconds DESC;
-            """
-            
-            usage = cur.execute(sql, (since,)).fetchall()
+            usage = cur.execute(self._SQL_USAGE, (since,)).fetchall()
             cur.close()
-            conn.close()
             
+            self._usage_cache[days] = usage
             return usage
             
         except Exception as e:
             print(f"❌ 查询数据库时出错：{e}")
             return []
     
-    def format_time(self, seconds):
-        """格式化时间显示"""
-        if seconds < 60:
-            return f"{seconds:.0f}秒"
-        elif seconds < 3600:
-            return f"{seconds/60:.1f}分钟"
-        else:
-            hours = seconds // 3600
-            minutes = (seconds % 3600) // 60
-            if minutes > 0:
-                return f"{hours:.0f}小时{minutes:.0f}分钟"
-            else:
-                return f"{hours:.1f}小时"
+    # 纯函数，结果按秒数缓存在 _format_time 上
+    format_time = staticmethod(_format_time)
     
-    def create_bar_chart(self, usage_data, max_width=30):
+    def create_bar_chart(self, usage_data, max_width=30, total_seconds=None):
         """创建ASCII条形图"""
         if not usage_data:
             return []
         
-        max_seconds = max(seconds for _, seconds in usage_data)  # 显示所有应用
-        chart_lines = []
+        _resolve_app_names(bundle_id for bundle_id, _ in usage_data)
         
-        for i, (bundle_id, seconds) in enumerate(usage_data):
-            app_name = self.get_app_name(bundle_id)
-            if len(app_name) > 15:
-                app_name = app_name[:12] + "..."
-            
-            # 计算条形长度
-            bar_length = int((seconds / max_seconds) * max_width)
-            bar = "█" * bar_length + "░" * (max_width - bar_length)
-            
-            percentage = (seconds / sum(s for _, s in usage_data)) * 100
-            time_str = self.format_time(seconds)
-            
-            chart_lines.append(f"{app_name:<15} {bar} {percentage:4.1f}% ({time_str})")
+        max_seconds = usage_data[0][1]  # SQL 已按时长降序排列
+        if total_seconds is None:
+            total_seconds = sum(seconds for _, seconds in usage_data)
         
-        return chart_lines
+        # 先算出名称和条形长度，再一次性格式化所有行
+        rows = [
+            (self.get_app_name(bundle_id), seconds, int((seconds / max_seconds) * max_width))
+            for bundle_id, seconds in usage_data
+        ]
+        
+        return [
+            f"{name[:12] + '...' if len(name) > 15 else name:<15} "
+            f"{'█' * bar_length}{'░' * (max_width - bar_length)} "
+            f"{(seconds / total_seconds) * 100:4.1f}% ({self.format_time(seconds)})"
+            for name, seconds, bar_length in rows
+        ]
     
     def get_hourly_usage(self, days=1):
         """获取每小时使用情况"""
         if not self.check_database():
-            return {}
+            return []
         
         try:
-            conn = sqlite3.connect(self.db_path)
-            cur = conn.cursor()
+            cur = self._get_conn().cursor()
             
             since = int((datetime.now() - timedelta(days=days)).timestamp()) - self.epoch_offset
             
-            sql = """
-            SELECT
-              ZOBJECT.ZVALUESTRING AS bundle_id,
-              ZOBJECT.ZSTARTDATE + 978307200 AS start_time,
-              ZOBJECT.ZENDDATE + 978307200 AS end_time,
-              ZOBJECT.ZENDDATE - ZOBJECT.ZSTARTDATE AS duration
-            FROM ZOBJECT
-            WHERE ZSTREAMNAME IN ('/app/usage','/app/inFocus')
-              AND ZSTARTDATE > ?
-              AND ZOBJECT.ZVALUESTRING IS NOT NULL
-              AND ZOBJECT.ZVALUESTRING != ''
-              AND ZOBJECT.ZENDDATE - ZOBJECT.ZSTARTDATE > 60
-            ORDER BY ZSTARTDATE;
-            """
-            
-            records = cur.execute(sql, (since,)).fetchall()
+            # 按小时统计（下标 0-23 即小时），直接从游标逐行读取
+            hourly_usage = [0] * 24
+            for hour, duration in cur.execute(self._SQL_HOURLY, (since,)):
+                hourly_usage[hour] = duration
             cur.close()
-            conn.close()
-            
-            # 按小时统计
-            hourly_usage = {}
-            for i in range(24):
-                hourly_usage[i] = 0
-            
-            for bundle_id, start_time, end_time, duration in records:
-                start_hour = datetime.fromtimestamp(start_time).hour
-                hourly_usage[start_hour] += duration
             
             return hourly_usage
             
         except Exception as e:
             print(f"❌ 查询每小时数据时出错：{e}")
-            return {}
+            return []
     
     def create_hourly_chart(self, hourly_usage, max_height=8):
         """创建每小时使用时间的ASCII图表"""
         if not hourly_usage:
             return []
         
-        max_usage = max(hourly_usage.values()) if hourly_usage.values() else 1
+        max_usage = max(hourly_usage)
         if max_usage == 0:
             max_usage = 1
         
-        chart_lines = []
-        
-        # 从上到下画图表
-        for level in range(max_height, 0, -1):
-            line = ""
-            for hour in range(24):
-                usage = hourly_usage.get(hour, 0)
-                height = int((usage / max_usage) * max_height)
-                if height >= level:
-                    line += "█"
-                else:
-                    line += " "
-            chart_lines.append(line)
+        # 每小时的柱高只计算一次，再从上到下画图表
+        heights = [
+            int((usage / max_usage) * max_height)
+            for usage in hourly_usage
+        ]
+        chart_lines = [
+            "".join("█" if height >= level else " " for height in heights)
+            for level in range(max_height, 0, -1)
+        ]
         
         # 添加时间标签
         hour_labels = ""
@@ -288,7 +377,7 @@ class ScreenTimeChecker:
             print("App的使用时长".center(60))
             print("─" * 60)
             
-            chart_lines = self.create_bar_chart(usage_data)
+            chart_lines = self.create_bar_chart(usage_data, total_seconds=total_seconds)
             for line in chart_lines:
                 print(f"  {line}")
             
@@ -306,24 +395,26 @@ class ScreenTimeChecker:
             
             print("-" * 50)
             
+            # 只显示前20个应用，显示的同时累计时长
+            displayed = usage_data[:20]
+            _resolve_app_names(bundle_id for bundle_id, _ in displayed)
+            
             displayed_seconds = 0
-            for i, (bundle_id, seconds) in enumerate(usage_data, 1):
+            for i, (bundle_id, seconds) in enumerate(displayed, 1):
                 app_name = self.get_app_name(bundle_id)
                 percentage = (seconds / total_seconds) * 100
                 
                 print(f"{i:2d}. {app_name:<25} {self.format_time(seconds):>12} ({percentage:4.1f}%)")
                 displayed_seconds += seconds
-                
-                if i >= 20:  # 只显示前20个应用
-                    remaining = len(usage_data) - 20
-                    if remaining > 0:
-                        remaining_seconds = total_seconds - displayed_seconds
-                        print(f"    ... 还有 {remaining} 个应用，剩余时长：{self.format_time(remaining_seconds)}")
-                    break
+            
+            remaining = len(usage_data) - 20
+            if remaining > 0:
+                remaining_seconds = total_seconds - displayed_seconds
+                print(f"    ... 还有 {remaining} 个应用，剩余时长：{self.format_time(remaining_seconds)}")
             
             if debug and len(usage_data) <= 20:
-                # 验证计算
-                manual_total = sum(seconds for _, seconds in usage_data)
+                # 验证计算：应用不超过20个时，逐行累计的时长就是手动总和
+                manual_total = displayed_seconds
                 print(f"\n🔍 计算验证：")
                 print(f"   自动计算总时长: {total_seconds:.0f} 秒")
                 print(f"   手动计算总时长: {manual_total:.0f} 秒")
@@ -343,6 +434,8 @@ class ScreenTimeChecker:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"screen_time_{days}days_{timestamp}.json"
         
+        _resolve_app_names(bundle_id for bundle_id, _ in usage_data)
+        
         export_data = {
             "export_time": datetime.now().isoformat(),
             "period_days": days,
@@ -358,37 +451,56 @@ class ScreenTimeChecker:
                 "usage_formatted": self.format_time(seconds)
             })
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(export_data, f, ensure_ascii=False, indent=2)
         
         print(f"✅ 数据已导出到：{filename}")
-
-def main():
-    checker = ScreenTimeChecker()
     
-    if len(sys.argv) == 1:
-        # 默认显示iPhone风格的24小时使用情况
-        checker.print_usage_report(1, visual=True)
-    else:
-        command = sys.argv[1].lower()
+    def create_index(self):
+        """为使用时长查询建立索引（需用户显式执行，会写入数据库）"""
+        if not self.check_database():
+            return
         
-        if command in ['1', '24h', 'today']:
-            checker.print_usage_report(1)
-        elif command in ['7', '7d', 'week']:
-            checker.print_usage_report(7)
-        elif command in ['30', '30d', 'month']:
-            checker.print_usage_report(30)
-        elif command in ['v', 'visual', 'iphone']:
-            days = int(sys.argv[2]) if len(sys.argv) > 2 else 1
-            checker.print_usage_report(days, visual=True)
-        elif command == 'export':
-            days = int(sys.argv[2]) if len(sys.argv) > 2 else 1
-            checker.export_to_json(days)
-        elif command == 'debug':
-            days = int(sys.argv[2]) if len(sys.argv) > 2 else 1
-            checker.print_usage_report(days, debug=True)
-        elif command == 'help':
-            print("""
+        try:
+            conn = sqlite3.connect(self.db_path, timeout=1)
+            try:
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_screen_time "
+                    "ON ZOBJECT(ZSTREAMNAME, ZSTARTDATE) "
+                    "WHERE ZVALUESTRING IS NOT NULL"
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"❌ 创建索引失败：{e}")
+            return
+        
+        print("✅ 已创建索引 idx_screen_time")
+
+# 命令别名 → (方法名, 天数, 额外参数)；天数为 None 时取第二个参数（默认1天）
+_DISPATCH = {
+    '1': ('print_usage_report', 1, {}),
+    '24h': ('print_usage_report', 1, {}),
+    'today': ('print_usage_report', 1, {}),
+    '7': ('print_usage_report', 7, {}),
+    '7d': ('print_usage_report', 7, {}),
+    'week': ('print_usage_report', 7, {}),
+    '30': ('print_usage_report', 30, {}),
+    '30d': ('print_usage_report', 30, {}),
+    'month': ('print_usage_report', 30, {}),
+    'v': ('print_usage_report', None, {'visual': True}),
+    'visual': ('print_usage_report', None, {'visual': True}),
+    'iphone': ('print_usage_report', None, {'visual': True}),
+    'export': ('export_to_json', None, {}),
+    'debug': ('print_usage_report', None, {'debug': True}),
+}
+
+_HELP_TEXT = """
 🔍 macOS 屏幕使用时间查询工具
 
 使用方法：
@@ -402,6 +514,7 @@ def main():
   v, visual, iphone [天数]  iPhone风格可视化界面
   debug [天数]     调试模式，显示详细计算信息
   export [天数]    导出JSON格式数据（默认1天）
+  index            为查询建立索引（会写入系统数据库，可选）
   help             显示此帮助信息
 
 示例：
@@ -415,7 +528,26 @@ def main():
 注意：
   - 首次运行需要授予 Terminal "完全磁盘访问" 权限
   - 数据来源：~/Library/Application Support/Knowledge/knowledgeC.db
-            """)
+            """
+
+def main():
+    checker = ScreenTimeChecker()
+    
+    if len(sys.argv) == 1:
+        # 默认显示iPhone风格的24小时使用情况
+        checker.print_usage_report(1, visual=True)
+    else:
+        command = sys.argv[1].lower()
+        method_name, days, kwargs = _DISPATCH.get(command, (None, None, None))
+        
+        if method_name is not None:
+            if days is None:
+                days = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+            getattr(checker, method_name)(days, **kwargs)
+        elif command == 'index':
+            checker.create_index()
+        elif command == 'help':
+            print(_HELP_TEXT)
         else:
             try:
                 days = int(command)